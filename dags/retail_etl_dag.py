@@ -9,6 +9,8 @@ from airflow.operators.python import PythonOperator
 
 from etl.transform import transform_properties, CLEAN_CSV_DEFAULT
 from etl.load import load_to_database, verify_load, get_db_config_from_env
+from etl.checkpoint import checkpoint_dir_for_run
+from etl.profiling import profiled
 
 # ------------- CONSTANT PATHS -----------------
 
@@ -16,7 +18,9 @@ CLEAN_CSV = CLEAN_CSV_DEFAULT    # e.g. Path("data/clean_properties.csv")
 
 
 # ------------- WRAPPER FUNCTIONS FOR AIRFLOW -----------------
+# @profiled is a no-op unless profiling is enabled (see etl/profiling.py)
 
+@profiled
 def extract_raw_properties(**context):
     
     #Extract step placeholder for API-based pipeline.
@@ -33,24 +37,37 @@ def extract_raw_properties(**context):
     print("Extract step OK - API key found; data will be fetched in transform step.")
 
 
+@profiled
 def transform_task_callable(**context):
     """
     Airflow-compatible wrapper to call transform_properties().
     Fetches from API, transforms in memory, and writes clean CSV.
+    Fetched pages are checkpointed per run so a retry resumes the extract.
     """
-    rows = transform_properties(clean_csv_path=CLEAN_CSV, save_clean_csv=True)
+    rows = transform_properties(
+        clean_csv_path=CLEAN_CSV,
+        save_clean_csv=True,
+        checkpoint_dir=checkpoint_dir_for_run(context.get("run_id")),
+    )
     print(f"Transform step completed with {rows} cleaned rows.")
 
 
+@profiled
 def load_task_callable(**context):
     """
     Airflow-compatible wrapper to call load_to_neon().
+    Commits in chunks; a retry resumes after the last committed chunk.
     """
     db_config = get_db_config_from_env()
-    loaded_rows = load_to_database(clean_csv_path=CLEAN_CSV, db_config=db_config)
+    loaded_rows = load_to_database(
+        clean_csv_path=CLEAN_CSV,
+        db_config=db_config,
+        checkpoint_dir=checkpoint_dir_for_run(context.get("run_id")),
+    )
     print(f"Load step completed. Attempted to load {loaded_rows} rows.")
 
 
+@profiled
 def verify_task_callable(**context):
     """
     Airflow-compatible wrapper to call verify_load().
@@ -77,6 +94,9 @@ with DAG(
     start_date=datetime(2025, 1, 1),
     catchup=False,
     tags=["Retail", "ETL", "PogresQSL", "Properties"],
+    # Trigger with {"profile": true} (CPU: cProfile / flamegraph) or
+    # "memory" / "all" (tracemalloc) to store artifacts per task
+    params={"profile": False},
 ) as dag:
 
     extract_task = PythonOperator(
@@ -0,0 +1,216 @@
+# etl/bench.py
+#
+# Offline benchmarks (no API / DB needed):
+#   python -m etl.bench memory --rows 1000000
+#   python -m etl.bench scaling --rows 1000000 --workers 1,2,4,8
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from etl.parallel import clean_in_parallel
+from etl.schema import CLEAN_COLUMNS, apply_clean_dtypes
+from etl.transform import assign_listing_ids, clean_properties
+
+# --------------------------------------------------------------------
+# SYNTHETIC DATA
+# --------------------------------------------------------------------
+
+STATES = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
+    "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
+    "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
+    "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
+    "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+]
+
+
+def make_clean_frame(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build `n_rows` of cleaned properties in the layout transform.py
+    produced before schema.py: Python-object strings, int64, float64.
+    Cardinalities are roughly US-shaped (50 states, ~20k cities, ~40k zips).
+    """
+    rng = np.random.default_rng(seed)
+
+    ids = np.arange(1, n_rows + 1)
+    price = rng.integers(50_000, 2_000_000, n_rows)
+    sqft = rng.integers(400, 6_000, n_rows)
+
+    df = pd.DataFrame(
+        {
+            "listing_id": pd.Series("MP" + pd.Series(ids).astype(str).str.zfill(6), dtype=object),
+            "address": pd.Series(
+                [f"{n % 9999 + 1} Main St Unit {n}" for n in ids], dtype=object
+            ),
+            "city": pd.Series(
+                [f"City {c}" for c in rng.integers(0, 20_000, n_rows)], dtype=object
+            ),
+            "state": pd.Series(rng.choice(STATES, n_rows), dtype=object),
+            "zip_code": pd.Series(
+                [f"{z:05d}" for z in rng.integers(0, 40_000, n_rows) * 2 + 501],
+                dtype=object,
+            ),
+            "price": price.astype("int64"),
+            "sqft": sqft.astype("int64"),
+            "price_per_sqft": (price / sqft).round(2),
+            "date_listed": pd.to_datetime("2015-01-01")
+            + pd.to_timedelta(rng.integers(0, 3_650, n_rows), unit="D"),
+        }
+    )
+    return df[CLEAN_COLUMNS]
+
+
+def make_raw_frame(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Build `n_rows` of raw RentCast-shaped records, including ~2% rows
+    with a date in squareFootage and no zip (the misalignment fix path)
+    and ~1% with missing addresses, so every cleaning path is exercised.
+    """
+    rng = np.random.default_rng(seed)
+
+    price = rng.integers(50_000, 2_000_000, n_rows).astype(object)
+    sqft = rng.integers(400, 6_000, n_rows).astype(object)
+    dates = (
+        pd.to_datetime("2015-01-01")
+        + pd.to_timedelta(rng.integers(0, 3_650, n_rows), unit="D")
+    ).strftime("%Y-%m-%dT00:00:00.000Z")
+    zips = np.array([f"{z:05d}" for z in rng.integers(501, 99_950, n_rows)], dtype=object)
+    addresses = np.array([f"{n % 9999 + 1} Main St" for n in range(n_rows)], dtype=object)
+
+    misaligned = rng.random(n_rows) < 0.02
+    sqft[misaligned] = np.asarray(dates[misaligned].str[:10], dtype=object)
+    zips[misaligned] = None
+    addresses[rng.random(n_rows) < 0.01] = None
+
+    return pd.DataFrame(
+        {
+            "addressLine1": addresses,
+            "city": [f"City {c}" for c in rng.integers(0, 20_000, n_rows)],
+            "state": rng.choice(STATES, n_rows),
+            "zipCode": zips,
+            "lastSalePrice": price,
+            "squareFootage": sqft,
+            "lastSaleDate": dates,
+        }
+    )
+
+
+# --------------------------------------------------------------------
+# BENCHMARKS
+# --------------------------------------------------------------------
+
+def memory_report(n_rows: int = 1_000_000) -> pd.DataFrame:
+    """
+    Compare deep memory usage (MB) per column of the old object/int64
+    layout against the compact schema.py dtypes.
+    """
+    before = make_clean_frame(n_rows)
+    after = apply_clean_dtypes(before)
+
+    mb = 1024 * 1024
+    report = pd.DataFrame(
+        {
+            "before_dtype": before.dtypes.astype(str),
+            "after_dtype": after.dtypes.astype(str),
+            "before_mb": before.memory_usage(deep=True, index=False) / mb,
+            "after_mb": after.memory_usage(deep=True, index=False) / mb,
+        }
+    )
+    report.loc["TOTAL", ["before_mb", "after_mb"]] = report[["before_mb", "after_mb"]].sum()
+    report["reduction_pct"] = (1 - report["after_mb"] / report["before_mb"]) * 100
+
+    return report.fillna({"before_dtype": "", "after_dtype": ""}).round(1)
+
+
+def scaling_report(n_rows: int, workers_list: list[int]) -> pd.DataFrame:
+    """
+    Time the cleaning step (clean + listing_id assignment) for each
+    worker count. workers=1 is the plain in-process path.
+
+    Every parallel result (clean rows, rejected rows and quality counts)
+    is checked against the single-process one; a mismatch (e.g. a
+    listing_id pointing at a different property) raises instead of
+    being reported as a speedup.
+    """
+    raw_df = make_raw_frame(n_rows)
+    rows = []
+    results = {}
+
+    for workers in workers_list:
+        start = time.perf_counter()
+        if workers > 1:
+            df, rejected, counts = clean_in_parallel(raw_df.copy(), workers=workers)
+        else:
+            df, rejected, counts = clean_properties(raw_df.copy())
+        df = assign_listing_ids(df)
+        elapsed = time.perf_counter() - start
+
+        results[workers] = (df, rejected.reset_index(drop=True), counts)
+
+        rows.append(
+            {
+                "workers": workers,
+                "seconds": round(elapsed, 2),
+                "rows_per_sec": int(n_rows / elapsed),
+                "clean_rows": len(df),
+            }
+        )
+
+    serial = results.get(1)
+    if serial is None:
+        df, rejected, counts = clean_properties(raw_df.copy())
+        serial = (assign_listing_ids(df), rejected.reset_index(drop=True), counts)
+
+    for workers, (df, rejected, counts) in results.items():
+        try:
+            pd.testing.assert_frame_equal(df, serial[0])
+            pd.testing.assert_frame_equal(rejected, serial[1])
+            assert counts == serial[2], f"quality counts differ: {counts} != {serial[2]}"
+        except AssertionError as exc:
+            raise RuntimeError(
+                f"workers={workers} produced different results than workers=1:\n{exc}"
+            ) from exc
+
+    report = pd.DataFrame(rows).set_index("workers")
+    report["speedup"] = (report["seconds"].iloc[0] / report["seconds"]).round(2)
+    return report
+
+
+# --------------------------------------------------------------------
+# CLI
+# --------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m etl.bench")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    mem = sub.add_parser("memory", help="memory of cleaned data: old vs compact dtypes")
+    mem.add_argument("--rows", type=int, default=1_000_000)
+
+    scale = sub.add_parser("scaling", help="cleaning time across worker process counts")
+    scale.add_argument("--rows", type=int, default=1_000_000)
+    scale.add_argument(
+        "--workers",
+        default=",".join(str(n) for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1)),
+        help="comma-separated worker counts, e.g. 1,2,4",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.bench == "memory":
+        print(f"Memory usage for {args.rows:,} cleaned rows:")
+        print(memory_report(args.rows).to_string())
+
+    elif args.bench == "scaling":
+        workers_list = [int(n) for n in args.workers.split(",")]
+        report = scaling_report(args.rows, workers_list)
+        print(f"\nCleaning {args.rows:,} raw rows ({os.cpu_count()} CPUs available):")
+        print(report.to_string())
+
+
+if __name__ == "__main__":
+    main()
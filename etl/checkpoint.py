@@ -0,0 +1,106 @@
+# etl/checkpoint.py
+
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+# --------------------------------------------------------------------
+# PATH SETUP
+# --------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# One sub-directory per DAG run lives under here
+CHECKPOINT_ROOT_DEFAULT = PROJECT_ROOT / "data" / "checkpoints"
+
+
+# --------------------------------------------------------------------
+# HELPERS
+# --------------------------------------------------------------------
+
+def checkpoint_dir_for_run(
+    run_id: str | None = None,
+    root: str | os.PathLike = CHECKPOINT_ROOT_DEFAULT,
+) -> Path:
+    """
+    Return the checkpoint directory for a given run.
+
+    Airflow run_ids contain characters like ':' and '+', so they are
+    sanitised into a safe directory name. Without a run_id (manual /
+    local runs) everything goes into a shared 'manual' directory.
+    """
+    name = re.sub(r"[^A-Za-z0-9_.-]", "_", run_id) if run_id else "manual"
+    return Path(root) / name
+
+
+def read_checkpoint(path: str | os.PathLike):
+    """
+    Read a JSON checkpoint (progress marker or saved page).
+    Returns None if it does not exist or is unreadable.
+    """
+    path = Path(path)
+
+    if not path.exists():
+        return None
+
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        print(f"Ignoring unreadable checkpoint at {path}")
+        return None
+
+
+def write_checkpoint(path: str | os.PathLike, payload) -> None:
+    """
+    Atomically write a JSON checkpoint (write temp file, then rename),
+    so a crash mid-write never leaves a half-written checkpoint behind.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as fh:
+        json.dump(payload, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def file_signature(path: str | os.PathLike) -> dict:
+    """
+    Identify a file by path, size and mtime.
+    Used to make sure a load checkpoint belongs to the CSV being loaded.
+    """
+    path = Path(path)
+    stat = path.stat()
+    return {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def clear_checkpoint(path: str | os.PathLike) -> None:
+    """
+    Remove a checkpoint file or directory once its step has completed.
+    """
+    path = Path(path)
+
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    elif path.exists():
+        path.unlink()
+
+
+def prune_run_dir(checkpoint_dir: str | os.PathLike) -> None:
+    """
+    Remove a run's checkpoint directory once its last checkpoint has been
+    cleared, so successful runs leave nothing behind.
+    """
+    try:
+        Path(checkpoint_dir).rmdir()
+    except OSError:
+        pass  # missing, or other checkpoints still live in it
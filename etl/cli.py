@@ -0,0 +1,237 @@
+# etl/cli.py
+#
+# Run the ETL without Airflow:
+#   python -m etl run --stage all --rows 1000 --workers 4
+#   python -m etl run --stage load --chunk-size 5000
+#   python -m etl run --pipelined --rows 100000
+#
+# Config comes from the same env vars / .env as the DAG. Stage modules
+# are imported lazily so `--help` stays fast.
+
+import argparse
+import contextlib
+import sys
+import time
+from datetime import datetime
+
+STAGES = ["extract", "transform", "load", "verify"]
+
+
+# --------------------------------------------------------------------
+# STAGES
+# --------------------------------------------------------------------
+
+def _extract(args, checkpoint_dir) -> int:
+    # Fetched rows are checkpointed, so the transform stage (now or in
+    # a later invocation with the same --run-id) cleans them without refetching
+    from etl.transform import _fetch_from_api
+
+    return len(_fetch_from_api(max_rows=args.rows, checkpoint_dir=checkpoint_dir))
+
+
+def _transform(args, checkpoint_dir) -> int:
+    from etl.transform import transform_properties
+
+    kwargs = {"workers": args.workers} if args.workers is not None else {}
+    return transform_properties(
+        clean_csv_path=args.csv,
+        save_clean_csv=True,
+        checkpoint_dir=checkpoint_dir,
+        max_rows=args.rows,
+        **kwargs,
+    )
+
+
+def _load(args, checkpoint_dir) -> int:
+    from etl.load import load_to_database
+
+    kwargs = {"chunk_size": args.chunk_size} if args.chunk_size is not None else {}
+    return load_to_database(
+        clean_csv_path=args.csv,
+        checkpoint_dir=checkpoint_dir,
+        **kwargs,
+    )
+
+
+def _verify(args, checkpoint_dir) -> None:
+    from etl.load import verify_load
+
+    verify_load(clean_csv_path=args.csv)
+
+
+def _pipelined(args, checkpoint_dir) -> int:
+    from etl.pipeline import run_pipeline
+    from etl.transform import TRANSFORM_WORKERS_DEFAULT
+
+    kwargs = {"batch_rows": args.batch_rows} if args.batch_rows is not None else {}
+    result = run_pipeline(
+        total_rows=args.rows,
+        clean_csv_path=args.csv,
+        workers=args.workers if args.workers is not None else TRANSFORM_WORKERS_DEFAULT,
+        **kwargs,
+    )
+    return result["rows_loaded"]
+
+
+STAGE_FUNCS = {
+    "extract": _extract,
+    "transform": _transform,
+    "load": _load,
+    "verify": _verify,
+}
+
+
+# --------------------------------------------------------------------
+# RUNNER
+# --------------------------------------------------------------------
+
+def run(args) -> list[dict]:
+    """
+    Run the requested stages in order and return their timings.
+
+    Multi-stage runs record each finished stage in stages.json in the
+    run's checkpoint directory; re-running with the same --run-id skips
+    those and resumes at the stage that failed.
+    """
+    from etl.checkpoint import (
+        checkpoint_dir_for_run,
+        clear_checkpoint,
+        read_checkpoint,
+        write_checkpoint,
+    )
+    from etl.profiling import profile_task, profiling_mode
+
+    checkpoint_dir = checkpoint_dir_for_run(args.run_id)
+    profile = args.profile or profiling_mode()
+
+    print(
+        f"Run id: {args.run_id} (checkpoints in {checkpoint_dir}); "
+        f"pass --run-id {args.run_id} to resume it."
+    )
+
+    if args.pipelined:
+        plan = [("pipelined", _pipelined), ("verify", _verify)]
+    elif args.stage == "all":
+        plan = [(name, STAGE_FUNCS[name]) for name in STAGES]
+    else:
+        plan = [(args.stage, STAGE_FUNCS[args.stage])]
+
+    # verify is cheap and checks the current DB state, so it always runs
+    stages_path = checkpoint_dir / "stages.json"
+    done = (read_checkpoint(stages_path) or []) if len(plan) > 1 else []
+
+    timings = []
+    for name, func in plan:
+        if name in done and name != "verify":
+            print(f"\n===> {name} (already completed in run {args.run_id}; skipping)")
+            continue
+
+        print(f"\n===> {name}")
+        ctx = (
+            profile_task(name, run_id=args.run_id, mode=profile)
+            if profile else contextlib.nullcontext()
+        )
+
+        start = time.perf_counter()
+        with ctx:
+            rows = func(args, checkpoint_dir)
+        timings.append(
+            {"stage": name, "seconds": time.perf_counter() - start, "rows": rows}
+        )
+
+        if len(plan) > 1 and name != "verify":
+            done.append(name)
+            write_checkpoint(stages_path, done)
+
+    # Every stage succeeded: nothing left to resume
+    if len(plan) > 1:
+        clear_checkpoint(checkpoint_dir)
+
+    return timings
+
+
+def print_timing_summary(timings: list[dict]) -> None:
+    total = sum(t["seconds"] for t in timings)
+
+    print("\nTiming summary:")
+    print(f"  {'stage':<10} {'seconds':>9} {'rows':>9}")
+    for t in timings:
+        rows = "" if t["rows"] is None else t["rows"]
+        print(f"  {t['stage']:<10} {t['seconds']:>9.2f} {rows:>9}")
+    print(f"  {'total':<10} {total:>9.2f}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m etl",
+        description="Run the properties ETL directly, without Airflow.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run one or all ETL stages")
+    run_p.add_argument(
+        "--stage", choices=STAGES + ["all"], default="all",
+        help="stage to run (default: all, in order)",
+    )
+    run_p.add_argument(
+        "--rows", type=int, default=30,
+        help="rows to fetch from the API (default: 30, same as the DAG)",
+    )
+    run_p.add_argument(
+        "--workers", type=int, default=None,
+        help="worker processes for the transform (default: TRANSFORM_WORKERS or 1)",
+    )
+    run_p.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="rows per load transaction (default: LOAD_CHUNK_SIZE or 1000)",
+    )
+    run_p.add_argument(
+        "--csv", default=None,
+        help="clean CSV path (default: data/clean_properties.csv)",
+    )
+    run_p.add_argument(
+        "--run-id", default=None,
+        help="checkpoint / profile directory name (default: a new cli_<timestamp> "
+        "per invocation); pass an earlier run's id to resume it",
+    )
+    run_p.add_argument(
+        "--pipelined", action="store_true",
+        help="overlap fetch, transform and load (etl.pipeline), then verify; "
+        "only valid with --stage all",
+    )
+    run_p.add_argument(
+        "--batch-rows", type=int, default=None,
+        help="rows per batch in --pipelined mode (default: PIPELINE_BATCH_ROWS or 500)",
+    )
+    run_p.add_argument(
+        "--profile", nargs="?", const="cpu", default=None, choices=["cpu", "memory", "all"],
+        help="store profiling artifacts per stage: cpu (default), memory or all "
+        "(same as ETL_PROFILE=<mode>)",
+    )
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.pipelined and args.stage != "all":
+        parser.error("--pipelined runs every stage; it cannot be combined with --stage")
+
+    if args.csv is None:
+        from etl.transform import CLEAN_CSV_DEFAULT
+
+        args.csv = CLEAN_CSV_DEFAULT
+
+    # A fresh id per invocation: resuming old checkpoints must be asked for
+    if args.run_id is None:
+        args.run_id = datetime.now().strftime("cli_%Y%m%dT%H%M%S_%f")
+
+    timings = run(args)
+    print_timing_summary(timings)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
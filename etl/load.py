@@ -6,6 +6,15 @@ import psycopg2
 from psycopg2.extras import execute_batch
 from dotenv import load_dotenv
 
+from etl.checkpoint import (
+    clear_checkpoint,
+    prune_run_dir,
+    file_signature,
+    read_checkpoint,
+    write_checkpoint,
+)
+from etl.schema import read_clean_csv
+
 # --------------------------------------------------------------------
 # ENV + PATH SETUP
 # --------------------------------------------------------------------
@@ -17,6 +26,9 @@ load_dotenv(PROJECT_ROOT / ".env")
 
 CLEAN_CSV_DEFAULT = PROJECT_ROOT / "data" / "clean_properties.csv"
 
+# Rows upserted per transaction; each committed chunk is checkpointed
+LOAD_CHUNK_SIZE_DEFAULT = int(os.getenv("LOAD_CHUNK_SIZE", "1000"))
+
 
 # --------------------------------------------------------------------
 # DB CONFIG
@@ -48,6 +60,65 @@ def get_db_config_from_env() -> dict:
     }
 
 
+# --------------------------------------------------------------------
+# SQL + SHARED HELPERS
+# --------------------------------------------------------------------
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS properties (
+        listing_id VARCHAR(10) PRIMARY KEY,
+        address   TEXT NOT NULL,
+        city      TEXT NOT NULL,
+        state     CHAR(2) NOT NULL,
+        zip_code  CHAR(5) NOT NULL,
+        price     INTEGER NOT NULL,
+        sqft      INTEGER NOT NULL,
+        price_per_sqft NUMERIC(10,2),
+        date_listed DATE
+    );
+"""
+
+UPSERT_SQL = """
+    INSERT INTO properties (
+        listing_id, address, city, state, zip_code,
+        price, sqft, price_per_sqft, date_listed
+    ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
+    ON CONFLICT (listing_id) DO UPDATE SET
+        price           = EXCLUDED.price,
+        sqft            = EXCLUDED.sqft,
+        price_per_sqft  = EXCLUDED.price_per_sqft,
+        date_listed     = EXCLUDED.date_listed;
+"""
+
+
+def upsert_frame(cur, df: pd.DataFrame) -> int:
+    """
+    Upsert a cleaned DataFrame into 'properties' on an open cursor.
+    Does NOT commit; the caller decides the transaction boundary.
+
+    Returns:
+        int: number of rows sent.
+    """
+    # Convert rows into tuples for execute_batch
+    records = [
+        (
+            r["listing_id"],
+            r["address"],
+            r["city"],
+            r["state"],
+            r["zip_code"],
+            int(r["price"]),
+            int(r["sqft"]),
+            round(float(r["price_per_sqft"]), 2) if pd.notna(r["price_per_sqft"]) else None,
+            r["date_listed"] if not pd.isna(r["date_listed"]) else None,
+        )
+        for _, r in df.iterrows()
+    ]
+
+    execute_batch(cur, UPSERT_SQL, records)
+    return len(records)
+
+
 # --------------------------------------------------------------------
 # LOAD STEP
 # --------------------------------------------------------------------
@@ -55,10 +126,16 @@ def get_db_config_from_env() -> dict:
 def load_to_database(
     clean_csv_path: str | os.PathLike = CLEAN_CSV_DEFAULT,
     db_config: dict | None = None,
+    chunk_size: int = LOAD_CHUNK_SIZE_DEFAULT,
+    checkpoint_dir: str | os.PathLike | None = None,
 ) -> int:
     """
     Load the cleaned CSV into the Postgres 'properties' table using upsert.
 
+    Rows are committed in chunks of `chunk_size`. If `checkpoint_dir` is
+    given, a progress marker is persisted after every committed chunk and
+    a retried task skips the chunks that were already committed.
+
     Returns:
         int: Number of rows attempted to load.
     """
@@ -67,11 +144,14 @@ def load_to_database(
     if not clean_csv_path.exists():
         raise FileNotFoundError(f"Clean CSV not found at {clean_csv_path}")
 
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
     if db_config is None:
         db_config = get_db_config_from_env()
 
-    # Read clean CSV
-    df = pd.read_csv(clean_csv_path, parse_dates=["date_listed"])
+    # Read clean CSV with the shared compact dtypes (no re-inference)
+    df = read_clean_csv(clean_csv_path)
 
     # Ensure we only load rows with a valid listing_id
     before = len(df)
@@ -82,9 +162,6 @@ def load_to_database(
             f"before load."
         )
 
-    # Make sure listing_id is string (matches VARCHAR PK)
-    df["listing_id"] = df["listing_id"].astype(str)
-
     print("Connecting to PostgreSQL ...")
     try:
         conn = psycopg2.connect(**db_config)
@@ -94,55 +171,40 @@ def load_to_database(
         raise RuntimeError(f"Connection failed: {e}")
 
     # Create table if not exists
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS properties (
-            listing_id VARCHAR(10) PRIMARY KEY,
-            address   TEXT NOT NULL,
-            city      TEXT NOT NULL,
-            state     CHAR(2) NOT NULL,
-            zip_code  CHAR(5) NOT NULL,
-            price     INTEGER NOT NULL,
-            sqft      INTEGER NOT NULL,
-            price_per_sqft NUMERIC(10,2),
-            date_listed DATE
-        );
-        """
-    )
+    cur.execute(CREATE_TABLE_SQL)
     conn.commit()
     print("Table 'properties' is ready.")
 
-    # Convert rows into tuples for execute_batch
-    records = [
-        (
-            r["listing_id"],
-            r["address"],
-            r["city"],
-            r["state"],
-            r["zip_code"],
-            int(r["price"]),
-            int(r["sqft"]),
-            float(r["price_per_sqft"]) if pd.notna(r["price_per_sqft"]) else None,
-            r["date_listed"] if not pd.isna(r["date_listed"]) else None,
-        )
-        for _, r in df.iterrows()
-    ]
-
-    upsert_sql = """
-        INSERT INTO properties (
-            listing_id, address, city, state, zip_code,
-            price, sqft, price_per_sqft, date_listed
-        ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        ON CONFLICT (listing_id) DO UPDATE SET
-            price           = EXCLUDED.price,
-            sqft            = EXCLUDED.sqft,
-            price_per_sqft  = EXCLUDED.price_per_sqft,
-            date_listed     = EXCLUDED.date_listed;
-    """
-
-    print(f"Loading {len(records)} records...")
-    execute_batch(cur, upsert_sql, records)
-    conn.commit()
+    # Resume after the last committed chunk, but only if the marker
+    # was written for this exact CSV (a re-run transform starts over)
+    marker_path = None
+    start_row = 0
+    source = file_signature(clean_csv_path)
+
+    if checkpoint_dir is not None:
+        marker_path = Path(checkpoint_dir) / "load.json"
+        marker = read_checkpoint(marker_path)
+        if marker and marker.get("source") == source:
+            start_row = int(marker.get("rows_committed", 0))
+            print(f"Resuming load from checkpoint: {start_row} rows already committed.")
+
+    print(f"Loading {len(df) - start_row} records in chunks of {chunk_size}...")
+
+    for chunk_start in range(start_row, len(df), chunk_size):
+        chunk = df.iloc[chunk_start:chunk_start + chunk_size]
+
+        upsert_frame(cur, chunk)
+        conn.commit()
+
+        # Marker is written after the commit: a crash in between only means
+        # this chunk is upserted again on retry, which is idempotent.
+        rows_committed = chunk_start + len(chunk)
+        if marker_path is not None:
+            write_checkpoint(
+                marker_path,
+                {"source": source, "rows_committed": rows_committed},
+            )
+        print(f"Committed {rows_committed}/{len(df)} rows.")
 
     # Optional: total count in table for info
     cur.execute("SELECT COUNT(*) FROM properties;")
@@ -152,9 +214,13 @@ def load_to_database(
     cur.close()
     conn.close()
 
+    if marker_path is not None:
+        clear_checkpoint(marker_path)
+        prune_run_dir(checkpoint_dir)
+
     print("LOAD COMPLETE! Data loaded into Neon.")
 
-    return len(records)
+    return len(df)
 
 
 # --------------------------------------------------------------------
@@ -181,7 +247,7 @@ def verify_load(
     if db_config is None:
         db_config = get_db_config_from_env()
 
-    df = pd.read_csv(clean_csv_path)
+    df = read_clean_csv(clean_csv_path, usecols=["listing_id"])
 
     # Only consider rows with a listing_id (same as load_to_neon)
     df = df[df["listing_id"].notna()].copy()
@@ -0,0 +1,117 @@
+# etl/parallel.py
+
+import contextlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from etl.quality import merge_quality_counts
+from etl.schema import HAS_PYARROW
+from etl.transform import SOURCE_COLUMNS, clean_properties
+
+# More partitions than workers evens out slow partitions
+PARTITIONS_PER_WORKER = 2
+
+
+# --------------------------------------------------------------------
+# WORKER
+# --------------------------------------------------------------------
+
+def _clean_partition(raw_path: str, out_dir: str, part_no: int) -> tuple[str, str, dict]:
+    """
+    Runs in a worker process: read one raw partition (Arrow IPC file),
+    clean it and write the clean / rejected rows back as Arrow files.
+    Only file paths and the small counters dict travel back to the parent.
+    """
+    # Raw columns arrive as nullable strings; clean_properties expects
+    # plain object columns like the ones built from the API JSON
+    raw_df = pd.read_feather(raw_path).astype(object)
+    raw_df = raw_df.where(raw_df.notna(), None)
+
+    df, rejected, counts = clean_properties(raw_df)
+
+    clean_path = Path(out_dir) / f"clean_{part_no:05d}.arrow"
+    rejected_path = Path(out_dir) / f"rejected_{part_no:05d}.arrow"
+    df.to_feather(clean_path)
+    rejected.reset_index(drop=True).to_feather(rejected_path)
+
+    return str(clean_path), str(rejected_path), counts
+
+
+# --------------------------------------------------------------------
+# PARENT
+# --------------------------------------------------------------------
+
+def clean_in_parallel(
+    raw_df: pd.DataFrame,
+    workers: int,
+    work_dir: str | os.PathLike | None = None,
+    pool: ProcessPoolExecutor | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """
+    Clean raw API rows across a pool of worker processes.
+
+    Raw rows are split into contiguous partitions written as Arrow IPC
+    (feather) files; workers clean them with transform.clean_properties()
+    and write Arrow files back, which are read in partition order.
+    No DataFrame is pickled between processes, and only the raw columns
+    clean_properties() reads (SOURCE_COLUMNS) are written.
+
+    Every quality rule is row-local, so partitioning does not change
+    which rows are kept; listing_ids are assigned afterwards
+    (assign_listing_ids) on the merged result, so they are identical
+    to a single-process run.
+
+    Callers cleaning many batches (e.g. etl.pipeline) pass their own
+    `pool` so worker processes are started once, not per batch.
+
+    Returns:
+        (clean_df, rejected_df, quality_counts) - same as clean_properties().
+    """
+    if not HAS_PYARROW:
+        raise RuntimeError(
+            "Parallel transform needs pyarrow (Arrow files are used to move "
+            "partitions between processes). Install it or use workers=1."
+        )
+
+    # Nested RentCast fields (features, history, owner) are never used;
+    # don't pay to stringify and ship them
+    raw_df = raw_df[[c for c in raw_df.columns if c.strip() in SOURCE_COLUMNS]]
+
+    n_parts = max(1, min(len(raw_df), workers * PARTITIONS_PER_WORKER))
+    step = -(-len(raw_df) // n_parts)  # ceil division
+
+    with tempfile.TemporaryDirectory(prefix="etl_parallel_", dir=work_dir) as tmp:
+        raw_paths = []
+        for part_no, start in enumerate(range(0, len(raw_df), step)):
+            raw_path = Path(tmp) / f"raw_{part_no:05d}.arrow"
+            # Raw API columns can mix types (e.g. dates in squareFootage),
+            # so they travel as nullable strings
+            partition = raw_df.iloc[start:start + step].reset_index(drop=True)
+            partition.astype("string").to_feather(raw_path)
+            raw_paths.append(str(raw_path))
+
+        print(f"Cleaning {len(raw_df)} rows in {len(raw_paths)} partitions on {workers} workers...")
+
+        owned_pool = ProcessPoolExecutor(max_workers=workers) if pool is None else None
+        with owned_pool or contextlib.nullcontext(pool) as executor:
+            futures = [
+                executor.submit(_clean_partition, raw_path, tmp, part_no)
+                for part_no, raw_path in enumerate(raw_paths)
+            ]
+            # Collect in submission order so row order matches the input
+            results = [future.result() for future in futures]
+
+        df = pd.concat(
+            [pd.read_feather(clean_path) for clean_path, _, _ in results],
+            ignore_index=True,
+        )
+        rejected = pd.concat(
+            [pd.read_feather(rejected_path) for _, rejected_path, _ in results],
+            ignore_index=True,
+        )
+
+    return df, rejected, merge_quality_counts([counts for _, _, counts in results])
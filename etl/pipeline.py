@@ -0,0 +1,304 @@
+# etl/pipeline.py
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import psycopg2
+
+from etl.load import CREATE_TABLE_SQL, get_db_config_from_env, upsert_frame
+from etl.quality import (
+    QUALITY_REPORT_DEFAULT,
+    QUARANTINE_CSV_DEFAULT,
+    merge_quality_counts,
+    print_quality_summary,
+    write_quality_report,
+    write_quarantine,
+)
+from etl.schema import CLEAN_COLUMNS
+from etl.transform import (
+    CLEAN_CSV_DEFAULT,
+    _fetch_from_api,
+    assign_listing_ids,
+    clean_properties,
+)
+
+# --------------------------------------------------------------------
+# CONFIG
+# --------------------------------------------------------------------
+
+# Rows fetched / cleaned / loaded per batch
+PIPELINE_BATCH_ROWS_DEFAULT = int(os.getenv("PIPELINE_BATCH_ROWS", "500"))
+
+# Max batches waiting between two stages. Together with one batch in
+# flight per stage this bounds memory to ~(2 * size + 3) batches.
+PIPELINE_QUEUE_SIZE_DEFAULT = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))
+
+# How often blocked stages wake up to check whether another stage failed
+_POLL_SECONDS = 0.5
+
+_DONE = object()  # end-of-stream marker passed down the queues
+
+
+# --------------------------------------------------------------------
+# STAGE BOOKKEEPING
+# --------------------------------------------------------------------
+
+@dataclass
+class StageStats:
+    """
+    Time split of one pipeline stage:
+    - busy: doing its own work (API call, cleaning, DB write)
+    - starved: waiting for input from the upstream stage
+    - blocked: waiting for room in the downstream queue (backpressure)
+    """
+    name: str
+    batches: int = 0
+    rows: int = 0
+    busy: float = 0.0
+    starved: float = 0.0
+    blocked: float = 0.0
+
+    def utilisation(self, wall: float) -> float:
+        return self.busy / wall if wall else 0.0
+
+
+class _Aborted(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+
+def _put(q: queue.Queue, item, stop: threading.Event, stats: StageStats) -> None:
+    start = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _Aborted()
+        try:
+            q.put(item, timeout=_POLL_SECONDS)
+            break
+        except queue.Full:
+            continue
+    stats.blocked += time.perf_counter() - start
+
+
+def _get(q: queue.Queue, stop: threading.Event, stats: StageStats):
+    start = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _Aborted()
+        try:
+            item = q.get(timeout=_POLL_SECONDS)
+            break
+        except queue.Empty:
+            continue
+    stats.starved += time.perf_counter() - start
+    return item
+
+
+# --------------------------------------------------------------------
+# PIPELINED RUN
+# --------------------------------------------------------------------
+
+def run_pipeline(
+    total_rows: int,
+    batch_rows: int = PIPELINE_BATCH_ROWS_DEFAULT,
+    queue_size: int = PIPELINE_QUEUE_SIZE_DEFAULT,
+    clean_csv_path: str | os.PathLike = CLEAN_CSV_DEFAULT,
+    quarantine_csv_path: str | os.PathLike = QUARANTINE_CSV_DEFAULT,
+    quality_report_path: str | os.PathLike = QUALITY_REPORT_DEFAULT,
+    db_config: dict | None = None,
+    workers: int = 1,
+) -> dict:
+    """
+    Run extract -> transform -> load as three overlapping stages.
+
+    Each stage is a thread connected to the next by a bounded queue, so
+    batch N+1 is fetched while batch N is cleaned and batch N-1 is loaded.
+    requests and psycopg2 release the GIL while waiting on the network,
+    which is what lets the stages overlap. A full queue blocks the
+    upstream stage (backpressure), keeping memory bounded.
+
+    The clean CSV, quarantine CSV and quality report are written
+    incrementally, so verify_load() works on the result as usual.
+
+    Returns:
+        dict: row totals and per-stage StageStats, plus wall time.
+    """
+    if batch_rows < 1 or queue_size < 1:
+        raise ValueError("batch_rows and queue_size must be >= 1")
+
+    if db_config is None:
+        db_config = get_db_config_from_env()
+
+    clean_csv_path = Path(clean_csv_path)
+    clean_csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Reset the outputs before any stage starts: if no batch ever arrives
+    # (total_rows=0, fetch fails), verify_load must not see the previous run
+    pd.DataFrame(columns=CLEAN_COLUMNS).to_csv(clean_csv_path, index=False)
+    for path in (quarantine_csv_path, quality_report_path):
+        Path(path).unlink(missing_ok=True)
+
+    raw_q: queue.Queue = queue.Queue(maxsize=queue_size)
+    clean_q: queue.Queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    fetch_stats = StageStats("fetch")
+    transform_stats = StageStats("transform")
+    load_stats = StageStats("load")
+    quality_counts: list[dict] = []
+
+    def fetch_stage():
+        fetched = 0
+        while fetched < total_rows:
+            start = time.perf_counter()
+            raw_df = _fetch_from_api(max_rows=min(batch_rows, total_rows - fetched))
+            fetch_stats.busy += time.perf_counter() - start
+            fetch_stats.batches += 1
+            fetch_stats.rows += len(raw_df)
+            fetched += len(raw_df)
+            _put(raw_q, raw_df, stop, fetch_stats)
+        _put(raw_q, _DONE, stop, fetch_stats)
+
+    def transform_stage():
+        next_id = 1
+        while True:
+            raw_df = _get(raw_q, stop, transform_stats)
+            if raw_df is _DONE:
+                break
+
+            start = time.perf_counter()
+            if workers > 1:
+                from etl.parallel import clean_in_parallel
+
+                df, rejected, counts = clean_in_parallel(raw_df, workers=workers, pool=pool)
+            else:
+                df, rejected, counts = clean_properties(raw_df)
+
+            # Single transform thread: listing_ids stay contiguous across batches
+            df = assign_listing_ids(df, start=next_id)
+            next_id += len(df)
+
+            df.to_csv(clean_csv_path, mode="a", header=False, index=False)
+            write_quarantine(rejected, quarantine_csv_path, append=True)
+            quality_counts.append(counts)
+
+            transform_stats.busy += time.perf_counter() - start
+            transform_stats.batches += 1
+            transform_stats.rows += len(df)
+            _put(clean_q, df, stop, transform_stats)
+        _put(clean_q, _DONE, stop, transform_stats)
+
+    def load_stage():
+        conn = psycopg2.connect(**db_config)
+        try:
+            cur = conn.cursor()
+            cur.execute(CREATE_TABLE_SQL)
+            conn.commit()
+
+            while True:
+                df = _get(clean_q, stop, load_stats)
+                if df is _DONE:
+                    break
+
+                # One transaction per batch
+                start = time.perf_counter()
+                upsert_frame(cur, df)
+                conn.commit()
+                load_stats.busy += time.perf_counter() - start
+                load_stats.batches += 1
+                load_stats.rows += len(df)
+
+            cur.close()
+        finally:
+            conn.close()
+
+    def guarded(stage):
+        def run():
+            try:
+                stage()
+            except _Aborted:
+                pass
+            except BaseException as e:
+                errors.append(e)
+                stop.set()  # unblock and stop the other stages
+        return run
+
+    print(
+        f"Pipelined run: {total_rows} rows in batches of {batch_rows}, "
+        f"queue size {queue_size}, {workers} transform worker(s)."
+    )
+
+    # One worker pool for the whole run instead of one per batch. The first
+    # submit starts the workers (with "fork", all of them at once), so they
+    # are forked before any stage thread or DB connection exists.
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pool.submit(int).result()
+
+    wall_start = time.perf_counter()
+    threads = [
+        threading.Thread(target=guarded(stage), name=f"etl-{name}", daemon=True)
+        for name, stage in (
+            ("fetch", fetch_stage),
+            ("transform", transform_stage),
+            ("load", load_stage),
+        )
+    ]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    wall = time.perf_counter() - wall_start
+
+    if errors:
+        raise errors[0]
+
+    merged_counts = merge_quality_counts(quality_counts)
+    print_quality_summary(merged_counts)
+    write_quality_report(merged_counts, quality_report_path)
+
+    stages = [fetch_stats, transform_stats, load_stats]
+    print_stage_report(stages, wall)
+
+    return {
+        "rows_fetched": fetch_stats.rows,
+        "rows_cleaned": transform_stats.rows,
+        "rows_loaded": load_stats.rows,
+        "wall_seconds": wall,
+        "stages": stages,
+    }
+
+
+def print_stage_report(stages: list[StageStats], wall: float) -> None:
+    """
+    Print per-stage utilisation: share of wall time spent busy, and time
+    lost waiting on upstream (starved) or downstream (blocked).
+    """
+    report = pd.DataFrame(
+        [
+            {
+                "stage": s.name,
+                "batches": s.batches,
+                "rows": s.rows,
+                "busy_s": round(s.busy, 2),
+                "starved_s": round(s.starved, 2),
+                "blocked_s": round(s.blocked, 2),
+                "utilisation_pct": round(100 * s.utilisation(wall), 1),
+            }
+            for s in stages
+        ]
+    ).set_index("stage")
+
+    print(f"\nPipeline finished in {wall:.2f}s:")
+    print(report.to_string())
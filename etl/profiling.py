@@ -0,0 +1,355 @@
+# etl/profiling.py
+#
+# Opt-in per-task profiling. Enable with ETL_PROFILE=cpu|memory|all
+# (1 / true = cpu) or the DAG param "profile": true / "<mode>".
+# Artifacts land in data/profiles/<run_id>/:
+#   <task>.pstats       cProfile stats (open with pstats / snakeviz)     [cpu]
+#   <task>.folded       sampled stacks, flamegraph.pl / speedscope format [cpu]
+#   <task>.memory.txt   tracemalloc top allocations + peak               [memory]
+#   <task>.json         wall time / peak memory summary
+#
+# CPU and memory are captured separately by default: tracemalloc slows
+# allocation-heavy pandas code several times over, which would swamp the
+# timings. "all" captures both and flags the timings as inflated.
+#
+# cProfile only sees the calling thread; the stack sampler also records
+# the etl-* threads of the pipelined runner (prefixed with the thread name).
+#
+# Compare two runs:
+#   python -m etl.profiling diff <run_id_a> <run_id_b> [--task T] [--top 20]
+
+import argparse
+import cProfile
+import functools
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from etl.checkpoint import checkpoint_dir_for_run
+
+# --------------------------------------------------------------------
+# CONFIG
+# --------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+PROFILE_ROOT_DEFAULT = PROJECT_ROOT / "data" / "profiles"
+
+# Stack sampling interval for the .folded flamegraph output
+SAMPLE_INTERVAL_SECONDS = 0.01
+
+# Allocation sites kept in the .memory.txt report
+MEMORY_TOP_N = 25
+
+
+PROFILE_MODES = ["cpu", "memory", "all"]
+
+
+def _parse_mode(value) -> str | None:
+    if value is True:
+        return "cpu"
+    if not value:
+        return None
+
+    value = str(value).lower()
+    if value in ("1", "true", "yes"):
+        return "cpu"
+    if value in ("0", "false", "no"):
+        return None
+    if value not in PROFILE_MODES:
+        raise RuntimeError(
+            f"Unknown profiling mode {value!r}; expected one of {PROFILE_MODES}"
+        )
+    return value
+
+
+def profiling_mode(context: dict | None = None) -> str | None:
+    """
+    Profiling mode from ETL_PROFILE, or from the Airflow params
+    {"profile": true | "cpu" | "memory" | "all"}. None = disabled.
+    """
+    mode = _parse_mode(os.getenv("ETL_PROFILE", ""))
+    if mode:
+        return mode
+
+    params = (context or {}).get("params") or {}
+    return _parse_mode(params.get("profile", False))
+
+
+def profiling_enabled(context: dict | None = None) -> bool:
+    """
+    True if profiling_mode(context) is set.
+    """
+    return profiling_mode(context) is not None
+
+
+def profile_dir_for_run(
+    run_id: str | None = None,
+    root: str | os.PathLike = PROFILE_ROOT_DEFAULT,
+) -> Path:
+    # Same sanitised naming as the checkpoint directories
+    return checkpoint_dir_for_run(run_id, root=root)
+
+
+# --------------------------------------------------------------------
+# STACK SAMPLER (flamegraph input)
+# --------------------------------------------------------------------
+
+class _StackSampler:
+    """
+    Samples the stack of one thread (plus any etl-* worker threads, e.g.
+    the pipelined runner's stages) from a background thread and counts
+    identical stacks, i.e. the "folded" format used by flamegraph tools.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == self.thread_id:
+                    stack = []
+                elif names.get(ident, "").startswith("etl-"):
+                    stack = [names[ident]]
+                else:
+                    continue
+
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                    frame = frame.f_back
+                if frames:
+                    self.stacks[";".join(stack + frames[::-1])] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: Path):
+        with open(path, "w") as fh:
+            for stack, count in self.stacks.most_common():
+                fh.write(f"{stack} {count}\n")
+
+
+# --------------------------------------------------------------------
+# TASK PROFILING
+# --------------------------------------------------------------------
+
+@contextmanager
+def profile_task(
+    task_name: str,
+    run_id: str | None = None,
+    root: str | os.PathLike = PROFILE_ROOT_DEFAULT,
+    mode: str = "cpu",
+):
+    """
+    Profile the enclosed block and write the artifacts to
+    <root>/<run_id>/<task_name>.*
+
+    mode "cpu" runs cProfile + stack sampling, "memory" runs tracemalloc,
+    "all" runs both (timings then include tracemalloc overhead).
+
+    Artifacts are written even if the block raises, since slow or failing
+    runs are the ones worth looking at.
+    """
+    if mode not in PROFILE_MODES:
+        raise RuntimeError(f"Unknown profiling mode {mode!r}; expected one of {PROFILE_MODES}")
+    cpu = mode in ("cpu", "all")
+    memory = mode in ("memory", "all")
+
+    out_dir = profile_dir_for_run(run_id, root=root)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    started_tracemalloc = False
+    if memory:
+        started_tracemalloc = not tracemalloc.is_tracing()
+        if started_tracemalloc:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+    if cpu:
+        profiler = cProfile.Profile()
+        sampler = _StackSampler(threading.get_ident())
+
+    wall_start = time.perf_counter()
+    if cpu:
+        sampler.start()
+        profiler.enable()
+    try:
+        yield out_dir
+    finally:
+        if cpu:
+            profiler.disable()
+            sampler.stop()
+        wall = time.perf_counter() - wall_start
+
+        base = out_dir / task_name
+        summary = {
+            "task": task_name,
+            "run_id": run_id,
+            "mode": mode,
+            "wall_seconds": round(wall, 3),
+            "peak_memory_mb": None,
+            "samples": None,
+            "timings_include_tracemalloc": memory,
+        }
+
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracemalloc:
+                tracemalloc.stop()
+
+            with open(f"{base}.memory.txt", "w") as fh:
+                fh.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MB\n\n")
+                for stat in snapshot.statistics("lineno")[:MEMORY_TOP_N]:
+                    fh.write(f"{stat}\n")
+            summary["peak_memory_mb"] = round(peak / 1024 / 1024, 1)
+
+        if cpu:
+            profiler.dump_stats(f"{base}.pstats")
+            sampler.write(Path(f"{base}.folded"))
+            summary["samples"] = sum(sampler.stacks.values())
+
+        Path(f"{base}.json").write_text(json.dumps(summary, indent=2))
+
+        peak_note = "" if summary["peak_memory_mb"] is None else f", peak {summary['peak_memory_mb']} MB"
+        slow_note = " (timed with tracemalloc on; use mode cpu for timings)" if memory else ""
+        print(
+            f"Profile ({mode}) for '{task_name}' saved to {out_dir} "
+            f"({summary['wall_seconds']}s{peak_note}){slow_note}."
+        )
+
+
+def profiled(task_callable):
+    """
+    Decorator for Airflow python_callables: profiles the task in
+    profiling_mode(context), or calls it unchanged when profiling is off.
+    """
+
+    @functools.wraps(task_callable)
+    def wrapper(**context):
+        mode = profiling_mode(context)
+        if mode is None:
+            return task_callable(**context)
+
+        task = context.get("task")
+        task_name = task.task_id if task is not None else task_callable.__name__
+
+        with profile_task(task_name, run_id=context.get("run_id"), mode=mode):
+            return task_callable(**context)
+
+    return wrapper
+
+
+# --------------------------------------------------------------------
+# DIFF CLI
+# --------------------------------------------------------------------
+
+def _function_times(pstats_path: Path) -> pd.DataFrame:
+    """
+    Per-function own time (tottime) and cumulative time from a .pstats file.
+    """
+    stats = pstats.Stats(str(pstats_path)).stats
+    rows = [
+        {
+            "function": f"{func} ({Path(filename).name}:{line})",
+            "tottime": tottime,
+            "cumtime": cumtime,
+        }
+        for (filename, line, func), (_, _, tottime, cumtime, _) in stats.items()
+    ]
+    # Same name can appear twice (e.g. builtins); add them up
+    return pd.DataFrame(rows).groupby("function").sum()
+
+
+def diff_runs(
+    run_a: str,
+    run_b: str,
+    task: str | None = None,
+    top: int = 20,
+    root: str | os.PathLike = PROFILE_ROOT_DEFAULT,
+) -> pd.DataFrame:
+    """
+    Compare hot spots between two profiled runs.
+    Returns the `top` functions with the largest change in own time.
+    """
+    dir_a = profile_dir_for_run(run_a, root=root)
+    dir_b = profile_dir_for_run(run_b, root=root)
+
+    tasks = [task] if task else sorted(
+        {p.stem for p in dir_a.glob("*.pstats")} & {p.stem for p in dir_b.glob("*.pstats")}
+    )
+    if not tasks:
+        raise FileNotFoundError(
+            f"No profiled tasks in common between {dir_a} and {dir_b}"
+        )
+
+    frames = []
+    for name in tasks:
+        a = _function_times(dir_a / f"{name}.pstats")
+        b = _function_times(dir_b / f"{name}.pstats")
+        merged = a.join(b, how="outer", lsuffix="_a", rsuffix="_b").fillna(0.0)
+        merged.insert(0, "task", name)
+        frames.append(merged)
+
+    report = pd.concat(frames)
+    report["delta_tottime"] = report["tottime_b"] - report["tottime_a"]
+    report = report.sort_values("delta_tottime", key=abs, ascending=False)
+
+    columns = ["task", "tottime_a", "tottime_b", "delta_tottime", "cumtime_a", "cumtime_b"]
+    return report[columns].head(top).round(4)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m etl.profiling")
+    parser.add_argument("--root", default=str(PROFILE_ROOT_DEFAULT), help="profile artifacts root")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list profiled runs and their task summaries")
+
+    diff = sub.add_parser("diff", help="compare hot spots of two runs")
+    diff.add_argument("run_a")
+    diff.add_argument("run_b")
+    diff.add_argument("--task", help="only compare this task")
+    diff.add_argument("--top", type=int, default=20)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for summary_path in sorted(Path(args.root).glob("*/*.json")):
+            summary = json.loads(summary_path.read_text())
+            peak = summary.get("peak_memory_mb")
+            print(
+                f"{summary_path.parent.name}  {summary['task']:<24} "
+                f"{summary.get('mode', 'all'):<6} {summary['wall_seconds']:>8}s"
+                + ("" if peak is None else f"  peak {peak} MB")
+            )
+
+    elif args.command == "diff":
+        report = diff_runs(args.run_a, args.run_b, task=args.task, top=args.top, root=args.root)
+        print(f"Top {len(report)} changes in own time (b - a), seconds:")
+        print(report.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+# etl/quality.py
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# --------------------------------------------------------------------
+# PATH SETUP
+# --------------------------------------------------------------------
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Rejected rows (with reason codes) and per-rule counters
+QUARANTINE_CSV_DEFAULT = PROJECT_ROOT / "data" / "quarantine_properties.csv"
+QUALITY_REPORT_DEFAULT = PROJECT_ROOT / "data" / "quality_report.json"
+
+
+# --------------------------------------------------------------------
+# BOUNDS
+# --------------------------------------------------------------------
+
+PRICE_MIN, PRICE_MAX = 1_000, 100_000_000
+SQFT_MIN, SQFT_MAX = 100, 100_000
+PRICE_PER_SQFT_MIN, PRICE_PER_SQFT_MAX = 5.0, 10_000.0
+
+DATE_LISTED_MIN = pd.Timestamp("1900-01-01")
+
+
+# --------------------------------------------------------------------
+# RULES
+# --------------------------------------------------------------------
+
+class QualityRule(NamedTuple):
+    """
+    A single data quality rule.
+
+    `check` takes the cleaned (snake_case) batch and returns a boolean
+    mask that is True for every row VIOLATING the rule.
+    """
+    code: str
+    description: str
+    check: Callable[[pd.DataFrame], pd.Series]
+
+
+def _out_of_range(values: pd.Series, low: float, high: float) -> pd.Series:
+    # Missing values are reported by the *_MISSING rules, not here
+    return values.notna() & ((values < low) | (values > high))
+
+
+def _date_out_of_range(df: pd.DataFrame) -> pd.Series:
+    # Missing dates are allowed (date_listed is nullable in Postgres)
+    dates = df["date_listed"]
+    low, high = DATE_LISTED_MIN, pd.Timestamp(datetime.now())
+
+    # RentCast dates come back as UTC timestamps; compare like with like
+    tz = getattr(dates.dt, "tz", None)
+    if tz is not None:
+        low, high = low.tz_localize(tz), pd.Timestamp.now(tz=tz)
+
+    return _out_of_range(dates, low, high)
+
+
+RULES: list[QualityRule] = [
+    QualityRule(
+        "ADDRESS_MISSING",
+        "address is empty",
+        lambda df: df["address"].isna(),
+    ),
+    QualityRule(
+        "CITY_MISSING",
+        "city is empty",
+        lambda df: df["city"].isna(),
+    ),
+    QualityRule(
+        "STATE_FORMAT",
+        "state is not a 2-letter code",
+        lambda df: ~df["state"].astype("string").str.fullmatch(r"[A-Za-z]{2}").fillna(False).astype(bool),
+    ),
+    QualityRule(
+        "ZIP_MISSING",
+        "zip_code is missing",
+        lambda df: df["zip_code"].isna(),
+    ),
+    QualityRule(
+        "ZIP_FORMAT",
+        "zip_code is not 5 digits",
+        lambda df: df["zip_code"].notna()
+        & ~df["zip_code"].astype("string").str.fullmatch(r"\d{5}").fillna(False).astype(bool),
+    ),
+    QualityRule(
+        "PRICE_MISSING",
+        "price is missing or not numeric",
+        lambda df: df["price"].isna(),
+    ),
+    QualityRule(
+        "PRICE_RANGE",
+        f"price outside [{PRICE_MIN}, {PRICE_MAX}]",
+        lambda df: _out_of_range(df["price"], PRICE_MIN, PRICE_MAX),
+    ),
+    QualityRule(
+        "SQFT_MISSING",
+        "sqft is missing or not numeric",
+        lambda df: df["sqft"].isna(),
+    ),
+    QualityRule(
+        "SQFT_RANGE",
+        f"sqft outside [{SQFT_MIN}, {SQFT_MAX}]",
+        lambda df: _out_of_range(df["sqft"], SQFT_MIN, SQFT_MAX),
+    ),
+    QualityRule(
+        "PRICE_PER_SQFT_OUTLIER",
+        f"price_per_sqft outside [{PRICE_PER_SQFT_MIN}, {PRICE_PER_SQFT_MAX}]",
+        lambda df: _out_of_range(df["price_per_sqft"], PRICE_PER_SQFT_MIN, PRICE_PER_SQFT_MAX),
+    ),
+    QualityRule(
+        "DATE_RANGE",
+        f"date_listed before {DATE_LISTED_MIN.date()} or in the future",
+        _date_out_of_range,
+    ),
+]
+
+
+# --------------------------------------------------------------------
+# VALIDATION
+# --------------------------------------------------------------------
+
+def validate_batch(
+    df: pd.DataFrame,
+    rules: list[QualityRule] = RULES,
+) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """
+    Evaluate every rule as a vectorised mask over one batch.
+
+    Returns:
+        (accepted, rejected, counts)
+        - rejected carries a 'reason_codes' column, e.g. "ZIP_FORMAT;PRICE_RANGE"
+        - counts holds row totals and the number of violations per rule
+    """
+    masks = {
+        rule.code: np.asarray(rule.check(df), dtype=bool)
+        for rule in rules
+    }
+
+    reject = np.zeros(len(df), dtype=bool)
+    for mask in masks.values():
+        reject |= mask
+
+    accepted = df[~reject].copy()
+    rejected = df[reject].copy()
+
+    # Build reason codes for rejected rows only
+    reasons = pd.Series("", index=rejected.index, dtype=object)
+    for code, mask in masks.items():
+        hit = mask[reject]
+        if hit.any():
+            reasons[hit] = reasons[hit] + code + ";"
+    # Plain str dtype, which is also what an Arrow round trip gives back
+    rejected["reason_codes"] = reasons.str.rstrip(";").astype(str)
+
+    counts = {
+        "rows_checked": len(df),
+        "rows_accepted": len(accepted),
+        "rows_rejected": len(rejected),
+        "rules": {code: int(mask.sum()) for code, mask in masks.items()},
+    }
+
+    return accepted, rejected, counts
+
+
+def merge_quality_counts(counts_list: list[dict]) -> dict:
+    """
+    Add up the counters of several batches (e.g. parallel partitions).
+    """
+    merged = {
+        "rows_checked": 0,
+        "rows_accepted": 0,
+        "rows_rejected": 0,
+        "rules": {rule.code: 0 for rule in RULES},
+    }
+
+    for counts in counts_list:
+        for key in ("rows_checked", "rows_accepted", "rows_rejected"):
+            merged[key] += counts[key]
+        for code, n in counts["rules"].items():
+            merged["rules"][code] = merged["rules"].get(code, 0) + n
+
+    return merged
+
+
+# --------------------------------------------------------------------
+# OUTPUTS
+# --------------------------------------------------------------------
+
+def print_quality_summary(counts: dict) -> None:
+    print(
+        f"Quality check: {counts['rows_checked']} rows checked, "
+        f"{counts['rows_accepted']} accepted, {counts['rows_rejected']} quarantined."
+    )
+    for code, n in counts["rules"].items():
+        if n:
+            print(f"  {code}: {n}")
+
+
+def write_quarantine(
+    rejected: pd.DataFrame,
+    quarantine_csv_path: str | os.PathLike = QUARANTINE_CSV_DEFAULT,
+    append: bool = False,
+) -> None:
+    """
+    Write rejected rows to the quarantine CSV.
+    With append=True, rows are added to an existing file (header written once).
+    """
+    quarantine_csv_path = Path(quarantine_csv_path)
+    quarantine_csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if append and quarantine_csv_path.exists():
+        rejected.to_csv(quarantine_csv_path, mode="a", header=False, index=False)
+    else:
+        rejected.to_csv(quarantine_csv_path, index=False)
+
+
+def write_quality_report(
+    counts: dict,
+    quality_report_path: str | os.PathLike = QUALITY_REPORT_DEFAULT,
+) -> None:
+    """
+    Export the per-rule counters as JSON.
+    """
+    quality_report_path = Path(quality_report_path)
+    quality_report_path.parent.mkdir(parents=True, exist_ok=True)
+    quality_report_path.write_text(json.dumps(counts, indent=2))
@@ -0,0 +1,91 @@
+# etl/schema.py
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+# pyarrow is optional: with it, free-text columns use compact Arrow strings
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# --------------------------------------------------------------------
+# CLEAN PROPERTIES SCHEMA
+# --------------------------------------------------------------------
+
+# Column order of the clean CSV / 'properties' table
+CLEAN_COLUMNS = [
+    "listing_id",
+    "address",
+    "city",
+    "state",
+    "zip_code",
+    "price",
+    "sqft",
+    "price_per_sqft",
+    "date_listed",
+]
+
+# Arrow strings store one contiguous buffer instead of a Python object per row
+STRING_DTYPE = "string[pyarrow]" if HAS_PYARROW else "string"
+
+# Zip codes: Arrow strings when available; otherwise a categorical,
+# which is also compact because zips repeat a lot (~40k distinct in the US)
+ZIP_DTYPE = STRING_DTYPE if HAS_PYARROW else "category"
+
+# Memory-efficient dtypes for the cleaned data.
+# - int32 is safe for price/sqft: quality.py caps them at 100M / 100k
+# - float32 is NOT exact for price_per_sqft (333.33 is held as 333.329987),
+#   but its ~7 significant digits cover the max of 10,000.00 to 2 decimals;
+#   values must be rounded to 2 decimals at load time (upsert_frame does)
+#   before they go into NUMERIC(10,2)
+CLEAN_DTYPES: dict[str, str] = {
+    "listing_id": STRING_DTYPE,
+    "address": STRING_DTYPE,
+    "city": "category",
+    "state": "category",
+    "zip_code": ZIP_DTYPE,
+    "price": "int32",
+    "sqft": "int32",
+    "price_per_sqft": "float32",
+}
+
+DATE_COLUMNS = ["date_listed"]
+
+
+# --------------------------------------------------------------------
+# HELPERS
+# --------------------------------------------------------------------
+
+def apply_clean_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast a cleaned DataFrame to the compact schema (columns not in
+    the schema are left untouched).
+    """
+    dtypes = {col: dtype for col, dtype in CLEAN_DTYPES.items() if col in df.columns}
+    return df.astype(dtypes)
+
+
+def read_clean_csv(
+    clean_csv_path: str | os.PathLike,
+    usecols: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read the clean CSV straight into the compact schema instead of
+    letting pandas re-infer types (which also drops leading zeros
+    from zip codes).
+    """
+    columns = usecols or CLEAN_COLUMNS
+    dtypes = {col: dtype for col, dtype in CLEAN_DTYPES.items() if col in columns}
+    parse_dates = [col for col in DATE_COLUMNS if col in columns]
+
+    return pd.read_csv(
+        Path(clean_csv_path),
+        usecols=usecols,
+        dtype=dtypes,
+        parse_dates=parse_dates,
+    )
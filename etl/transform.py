@@ -225,6 +225,7 @@ def transform_properties(
 
 # etl/transform.py
 
+import json
 import os
 import re
 from pathlib import Path
@@ -233,6 +234,22 @@ import pandas as pd
 import requests
 from dotenv import load_dotenv
 
+from etl.checkpoint import (
+    clear_checkpoint,
+    prune_run_dir,
+    read_checkpoint,
+    write_checkpoint,
+)
+from etl.quality import (
+    QUALITY_REPORT_DEFAULT,
+    QUARANTINE_CSV_DEFAULT,
+    print_quality_summary,
+    validate_batch,
+    write_quality_report,
+    write_quarantine,
+)
+from etl.schema import CLEAN_COLUMNS, apply_clean_dtypes
+
 # Load .env for local dev; in Docker/Railway this will do nothing
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 load_dotenv(PROJECT_ROOT / ".env")
@@ -251,6 +268,23 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 # Default path for cleaned CSV output
 CLEAN_CSV_DEFAULT = BASE_DIR / "data" / "clean_properties.csv"
 
+# Raw API keys clean_properties() reads (RentCast, mock and title-case
+# styles); everything else in the payload (features, owner, ...) is ignored
+SOURCE_COLUMNS = [
+    "addressLine1", "city", "state", "zipCode",
+    "address", "zip_code",
+    "lastSalePrice", "price",
+    "squareFootage", "sqft",
+    "lastSaleDate", "date_listed",
+    "Address", "City", "State", "Zip Code", "Price", "Sqft", "Date Listed",
+]
+
+# Rows fetched between extract checkpoints (each one is an fsync + marker write)
+EXTRACT_CHECKPOINT_ROWS = int(os.getenv("EXTRACT_CHECKPOINT_ROWS", "1000"))
+
+# Worker processes for the cleaning step (1 = in-process, see parallel.py)
+TRANSFORM_WORKERS_DEFAULT = int(os.getenv("TRANSFORM_WORKERS", "1"))
+
 
 # --------------------------------------------------
 # API extract helpers
@@ -281,22 +315,119 @@ def _get_random_properties(limit: int = 5):
     return response.json()  # expect list of property dicts
 
 
-def _fetch_from_api(max_rows: int = 20) -> pd.DataFrame:
+def _load_extract_checkpoint(extract_dir: Path, max_rows: int) -> list[dict]:
+    """
+    Load up to `max_rows` rows fetched by a previous (failed) attempt.
+
+    Rows live in one JSON-lines file; progress.json records how many bytes
+    of it were durably written at the last checkpoint. Anything after that
+    offset (rows fetched after the last checkpoint, or a torn write) is
+    cut off, so old and new rows are never mixed. Rows beyond `max_rows`
+    are cut off too, so the file always matches the rows in use.
+    """
+    rows_path = extract_dir / "rows.jsonl"
+    marker = read_checkpoint(extract_dir / "progress.json")
+
+    if not marker or not rows_path.exists():
+        clear_checkpoint(extract_dir)
+        return []
+
+    committed = int(marker.get("bytes", 0))
+    if rows_path.stat().st_size < committed:
+        print(f"Extract checkpoint in {extract_dir} is inconsistent; starting over.")
+        clear_checkpoint(extract_dir)
+        return []
+
+    rows: list[dict] | None = []
+    kept_bytes = 0
+    with open(rows_path, "r+b") as fh:
+        fh.truncate(committed)
+        fh.seek(0)
+        try:
+            for line in fh:
+                if len(rows) == max_rows:
+                    break
+                rows.append(json.loads(line))
+                kept_bytes += len(line)
+        except ValueError:
+            rows = None
+        else:
+            fh.truncate(kept_bytes)
+
+    if rows is None:
+        print(f"Extract checkpoint in {extract_dir} is unreadable; starting over.")
+        clear_checkpoint(extract_dir)
+        return []
+
+    if kept_bytes < committed:
+        write_checkpoint(
+            extract_dir / "progress.json",
+            {"rows": len(rows), "bytes": kept_bytes},
+        )
+
+    return rows
+
+
+def _fetch_from_api(
+    max_rows: int = 20,
+    checkpoint_dir: str | os.PathLike | None = None,
+) -> pd.DataFrame:
     """
     Fetch up to `max_rows` properties from the API
     and return them as a DataFrame.
+
+    If `checkpoint_dir` is given, fetched rows are appended to one file
+    there and checkpointed every EXTRACT_CHECKPOINT_ROWS rows; a retried
+    task resumes after the last checkpoint.
     """
     rows: list[dict] = []
+    extract_dir = None
+    rows_file = None
+
+    if checkpoint_dir is not None:
+        extract_dir = Path(checkpoint_dir) / "extract"
+        rows = _load_extract_checkpoint(extract_dir, max_rows)
+        if rows:
+            print(f"Using {len(rows)} rows already fetched into {extract_dir}.")
+        extract_dir.mkdir(parents=True, exist_ok=True)
+        rows_file = open(extract_dir / "rows.jsonl", "ab")
+
+    def checkpoint():
+        # Make the rows durable first, then move the marker past them
+        rows_file.flush()
+        os.fsync(rows_file.fileno())
+        write_checkpoint(
+            extract_dir / "progress.json",
+            {"rows": len(rows), "bytes": rows_file.tell()},
+        )
 
-    while len(rows) < max_rows:
-        remaining = max_rows - len(rows)
-        batch_limit = min(5, remaining)  # RentCast per-request limit
-        data = _get_random_properties(limit=batch_limit)
-
-        if not data:
-            break  # no data returned
-
-        rows.extend(data)
+    uncommitted = 0
+    try:
+        while len(rows) < max_rows:
+            remaining = max_rows - len(rows)
+            batch_limit = min(5, remaining)  # RentCast per-request limit
+            data = _get_random_properties(limit=batch_limit)
+
+            if not data:
+                break  # no data returned
+
+            rows.extend(data)
+
+            if rows_file is not None:
+                rows_file.write(
+                    "".join(json.dumps(row) + "\n" for row in data).encode()
+                )
+                uncommitted += len(data)
+                if uncommitted >= EXTRACT_CHECKPOINT_ROWS:
+                    checkpoint()
+                    uncommitted = 0
+
+    finally:
+        # Also runs when a fetch fails, so a retry keeps the pages fetched so far
+        if rows_file is not None:
+            if uncommitted:
+                checkpoint()
+            rows_file.close()
 
     if not rows:
         raise RuntimeError("No data fetched from API; cannot transform.")
@@ -308,25 +439,20 @@ def _fetch_from_api(max_rows: int = 20) -> pd.DataFrame:
 
 
 # --------------------------------------------------
-# Transform (NO Postgres load here)
+# Cleaning helpers (pure: no API, no files)
 # --------------------------------------------------
-def transform_properties(
-    clean_csv_path: str | os.PathLike = CLEAN_CSV_DEFAULT,
-    save_clean_csv: bool = True,
-) -> int:
-    """
-    Fetch raw data from the API, clean and transform it,
-    and optionally save the cleaned result to clean_csv_path.
-
-    - Does NOT load to Postgres (that's handled in load.py).
-    - Returns:
-        int: number of rows in the cleaned dataset.
+def clean_properties(raw_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
     """
+    Clean one batch of raw API rows.
 
-    clean_csv_path = Path(clean_csv_path)
+    Runs the column mapping, misalignment fix, zip / numeric / date
+    coercion and the quality rules. listing_id is NOT assigned here, so
+    batches can be cleaned independently (e.g. in worker processes) and
+    numbered afterwards with assign_listing_ids().
 
-    # 1) EXTRACT directly from API
-    raw_df = _fetch_from_api(max_rows=30)
+    Returns:
+        (clean_df, rejected_df, quality_counts)
+    """
 
     # ---- FIX 1: Normalize incoming column names (strip whitespace)
     raw_df.columns = [c.strip() for c in raw_df.columns]
@@ -396,9 +522,6 @@ def transform_properties(
 
     df = df[required_cols]
 
-    print("First few rows (raw from API, mapped):")
-    print(df.head(10))
-
     print("\nFixing column misalignment due to date in Sqft / missing Zip Code (if any)...")
 
     # Detect rows where Sqft holds a date-like value (YYYY-MM-DD)
@@ -407,18 +530,24 @@ def transform_properties(
 
     print(f"Found {bad_mask.sum()} misaligned rows")
     if bad_mask.any():
+        # Swapped values have mixed types; object columns accept them
+        # (pandas refuses to set date strings into an int64 column)
+        df = df.astype({"Zip Code": object, "Price": object, "Sqft": object})
         bad = df[bad_mask].copy()
         df.loc[bad_mask, "Zip Code"] = pd.NA
         df.loc[bad_mask, "Price"] = bad["Sqft"]
         df.loc[bad_mask, "Sqft"] = bad["Price"]
         df.loc[bad_mask, "Date Listed"] = bad["Date Listed"]
 
-    # Drop rows with missing Address (critical field)
-    df = df.dropna(subset=["Address"])
-    print(f"After dropping rows with missing Address: {len(df)} rows")
-
-    # Clean Zip Code
-    df["Zip Code"] = df["Zip Code"].fillna(0).astype(int).astype(str).str.zfill(5)
+    # Clean Zip Code: numeric zips are zero-padded, missing ones stay NA
+    # for the ZIP_MISSING rule; anything else is kept as-is so the
+    # ZIP_FORMAT rule flags it
+    zip_num = pd.to_numeric(df["Zip Code"], errors="coerce")
+    zip_padded = zip_num.fillna(0).astype("int64").astype(str).str.zfill(5)
+    df["Zip Code"] = zip_padded.where(
+        zip_num.notna(),
+        df["Zip Code"].astype("string"),
+    )
 
     # Rename columns to snake_case
     df.columns = [
@@ -435,42 +564,86 @@ def transform_properties(
     df["price"] = pd.to_numeric(df["price"], errors="coerce")
     df["sqft"] = pd.to_numeric(df["sqft"], errors="coerce")
 
-    print(f"Before dropping NA price/sqft: {len(df)} rows")
-    df = df.dropna(subset=["price", "sqft"])
-    print(f"After dropping NA price/sqft: {len(df)} rows")
+    # Dates and derived columns
+    df["date_listed"] = pd.to_datetime(df["date_listed"], errors="coerce")
+    df["price_per_sqft"] = (df["price"] / df["sqft"]).round(2)
+
+    # Data quality rules: one vectorised pass, rejected rows quarantined
+    df, rejected, quality_counts = validate_batch(df)
+
+    # Pin the compact dtypes (see schema.py)
+    df = apply_clean_dtypes(df.reset_index(drop=True))
+
+    return df, rejected, quality_counts
 
-    df["price"] = df["price"].astype(int)
-    df["sqft"] = df["sqft"].astype(int)
 
+def assign_listing_ids(df: pd.DataFrame, start: int = 1) -> pd.DataFrame:
+    """
+    Number cleaned rows MP000001, MP000002, ... starting at `start`
+    and return them in the final column order.
+    """
     # Reset index so listing_id lines up with rows
     df = df.reset_index(drop=True)
 
-    # Dates and derived columns
-    df["date_listed"] = pd.to_datetime(df["date_listed"], errors="coerce")
-    df["price_per_sqft"] = (df["price"] / df["sqft"]).round(2)
-
     # Add listing_id (now guaranteed for every row)
     df["listing_id"] = (
-        "MP" + (df.index + 1).astype(str).str.zfill(6)
+        "MP" + (df.index + start).astype(str).str.zfill(6)
     )
 
-    # Reorder columns
-    df = df[
-        [
-            "listing_id",
-            "address",
-            "city",
-            "state",
-            "zip_code",
-            "price",
-            "sqft",
-            "price_per_sqft",
-            "date_listed",
-        ]
-    ]
+    # Reorder columns and pin the compact dtypes (see schema.py)
+    return apply_clean_dtypes(df[CLEAN_COLUMNS])
 
-    print("\nCLEAN & TRANSFORMED DATA:")
-    print(df.to_string(index=False))
+
+# --------------------------------------------------
+# Transform (NO Postgres load here)
+# --------------------------------------------------
+def transform_properties(
+    clean_csv_path: str | os.PathLike = CLEAN_CSV_DEFAULT,
+    save_clean_csv: bool = True,
+    checkpoint_dir: str | os.PathLike | None = None,
+    quarantine_csv_path: str | os.PathLike = QUARANTINE_CSV_DEFAULT,
+    quality_report_path: str | os.PathLike = QUALITY_REPORT_DEFAULT,
+    max_rows: int = 30,
+    workers: int = TRANSFORM_WORKERS_DEFAULT,
+) -> int:
+    """
+    Fetch raw data from the API, clean and transform it,
+    and optionally save the cleaned result to clean_csv_path.
+
+    - Does NOT load to Postgres (that's handled in load.py).
+    - Rows failing the quality rules (quality.py) are written to
+      quarantine_csv_path with reason codes, and per-rule counters
+      to quality_report_path (both only when save_clean_csv is True).
+    - If checkpoint_dir is given, fetched rows are checkpointed there
+      and removed once the cleaned CSV has been written.
+    - With workers > 1, cleaning runs in a process pool (parallel.py).
+    - Returns:
+        int: number of rows in the cleaned dataset.
+    """
+
+    clean_csv_path = Path(clean_csv_path)
+
+    # 1) EXTRACT directly from API (resumes from the extract checkpoint, if any)
+    raw_df = _fetch_from_api(max_rows=max_rows, checkpoint_dir=checkpoint_dir)
+
+    print("First few rows (raw from API):")
+    print(raw_df.head(10))
+
+    # 2) CLEAN, in-process or partitioned across worker processes
+    if workers > 1:
+        from etl.parallel import clean_in_parallel
+
+        df, rejected, quality_counts = clean_in_parallel(raw_df, workers=workers)
+    else:
+        df, rejected, quality_counts = clean_properties(raw_df)
+
+    print_quality_summary(quality_counts)
+
+    # 3) Number rows once, over the whole cleaned dataset
+    df = assign_listing_ids(df)
+
+    print(f"\nCLEAN & TRANSFORMED DATA ({len(df)} rows, first 20 shown):")
+    print(df.head(20).to_string(index=False))
 
     # Save cleaned CSV for load.py
     if save_clean_csv:
@@ -479,4 +652,16 @@ def transform_properties(
         print(f"\nClean data saved to {clean_csv_path}")
         print("Ready for PostgreSQL load by load.py!")
 
+        write_quarantine(rejected, quarantine_csv_path)
+        write_quality_report(quality_counts, quality_report_path)
+        print(
+            f"Quarantined {len(rejected)} row(s) to {quarantine_csv_path}; "
+            f"quality report saved to {quality_report_path}"
+        )
+
+    # Extracted rows are no longer needed once the transform has finished
+    if checkpoint_dir is not None:
+        clear_checkpoint(Path(checkpoint_dir) / "extract")
+        prune_run_dir(checkpoint_dir)
+
     return len(df)